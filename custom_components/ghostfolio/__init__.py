@@ -3,14 +3,17 @@ from __future__ import annotations
 
 import logging
 import asyncio
-from datetime import datetime, timedelta, timezone
-from typing import Any
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Iterable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.util import slugify
 
 
@@ -18,12 +21,21 @@ from .api import GhostfolioAPI
 from .const import (
     CONF_UPDATE_INTERVAL, 
     DEFAULT_UPDATE_INTERVAL, 
+    DEFAULT_NAME,
+    CONF_PORTFOLIO_NAME,
     CONF_SHOW_TOTALS,
     CONF_SHOW_ACCOUNTS,
     CONF_SHOW_HOLDINGS,
     CONF_SHOW_WATCHLIST,
     DOMAIN,
-    DATA_PROVIDERS
+    DATA_PROVIDERS,
+    DATA_PROVIDER_IDS,
+    MARKET_DATA_CONCURRENCY,
+    MARKET_DATA_CACHE_TTL,
+    ACCOUNTS_CACHE_TTL,
+    OFF_HOURS_UPDATE_INTERVAL,
+    UNCHANGED_CYCLES_BEFORE_BACKOFF,
+    MARKET_SESSIONS_UTC,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,7 +52,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
 
     update_interval = entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
-    coordinator = GhostfolioDataUpdateCoordinator(hass, api, update_interval, entry)
+    cfg = CoordinatorConfig.from_entry(entry)
+    coordinator = GhostfolioDataUpdateCoordinator(hass, api, update_interval, entry, cfg)
     
     await coordinator.async_config_entry_first_refresh()
 
@@ -53,13 +66,119 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await entry.runtime_data.api.close()
+    return unload_ok
+
+
+@dataclass(frozen=True)
+class CoordinatorConfig:
+    """Entity options of a config entry, resolved once at setup."""
+
+    show_totals: bool
+    show_accounts: bool
+    show_holdings: bool
+    show_watchlist: bool
+    portfolio_name: str
+
+    @classmethod
+    def from_entry(cls, entry: ConfigEntry) -> CoordinatorConfig:
+        """Build the options from the config entry data."""
+        return cls(
+            show_totals=entry.data.get(CONF_SHOW_TOTALS, True),
+            show_accounts=entry.data.get(CONF_SHOW_ACCOUNTS, True),
+            show_holdings=entry.data.get(CONF_SHOW_HOLDINGS, True),
+            show_watchlist=entry.data.get(CONF_SHOW_WATCHLIST, True),
+            portfolio_name=entry.data.get(CONF_PORTFOLIO_NAME, DEFAULT_NAME),
+        )
+
+
+def _offline_data() -> dict[str, Any]:
+    """Return the default "Offline" data structure."""
+    return {
+        "server_online": False,
+        "accounts": {},
+        "global_performance": {},
+        "account_performances": {},
+        "account_holdings": {},
+        "watchlist": [],
+        "providers": {}
+    }
+
+
+def _price(entry: dict[str, Any]) -> float:
+    """Return the marketPrice of a market data entry as a number (0 if missing)."""
+    value = entry.get("marketPrice")
+    # The API normally returns floats already, so skip the float() coercion
+    if isinstance(value, float):
+        return value
+    return float(value or 0)
+
+
+def is_active_holding(holding: dict[str, Any]) -> bool:
+    """Return True if the holding has a positive quantity (False if it is malformed)."""
+    try:
+        return float(holding.get("quantity") or 0) > 0
+    except (TypeError, ValueError):
+        _LOGGER.debug(f"Skipping holding {holding.get('symbol')} with invalid quantity: {holding.get('quantity')}")
+        return False
+
+
+def is_market_open(assets: Iterable[dict[str, Any]], now: datetime | None = None) -> bool:
+    """Return True if the exchange of any tracked asset is currently in session."""
+    now = now or datetime.now(timezone.utc)
+    is_weekday = now.weekday() < 5
+    minute_of_day = now.hour * 60 + now.minute
+    tracked = False
+
+    for asset in assets:
+        # Crypto trades around the clock
+        if asset.get("dataSource") == "COINGECKO" or asset.get("assetSubClass") == "CRYPTOCURRENCY":
+            return True
+
+        currency = asset.get("currency")
+        if not currency:
+            continue
+
+        session = MARKET_SESSIONS_UTC.get(currency)
+        if session is None:
+            # Unknown exchange, assume it may be trading
+            return True
+
+        tracked = True
+        if is_weekday and session[0] <= minute_of_day < session[1]:
+            return True
+
+    # Without any tracked asset we cannot tell, so keep polling normally
+    return not tracked
 
 
 class GhostfolioDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching Ghostfolio data."""
 
-    def __init__(self, hass: HomeAssistant, api: GhostfolioAPI, update_interval_minutes: int, entry: ConfigEntry) -> None:
+    # unique_id keys of the global sensors: ghostfolio_{key}_{entry_id}
+    _TOTALS_KEYS = (
+        "current_value",
+        "net_performance",
+        "net_performance_percent",
+        "total_investment",
+        "net_performance_percent_with_currency",
+        "net_performance_with_currency",
+        "simple_gain_percent",
+    )
+
+    # unique_id keys of the per-account sensors: ghostfolio_{key}_{account_id}_{entry_id}
+    _ACCOUNT_KEYS = (
+        "account_value",
+        "account_net_worth",
+        "account_cost",
+        "account_perf",
+        "account_perf_pct",
+        "account_simple_gain",
+    )
+
+    def __init__(self, hass: HomeAssistant, api: GhostfolioAPI, update_interval_minutes: int, entry: ConfigEntry, cfg: CoordinatorConfig) -> None:
         """Initialize coordinator."""
         super().__init__(
             hass,
@@ -69,149 +188,325 @@ class GhostfolioDataUpdateCoordinator(DataUpdateCoordinator):
         )
         self.api = api
         self.entry = entry
+        self.cfg = cfg
+
+        # Device info shared by reference across all entities of this entry
+        self.portfolio_device_id = (DOMAIN, f"ghostfolio_portfolio_{entry.entry_id}")
+        self.device_info = DeviceInfo(
+            identifiers={self.portfolio_device_id},
+            name=f"{cfg.portfolio_name} Portfolio",
+            manufacturer="Ghostfolio",
+            model="Portfolio Tracker",
+        )
+        self._account_device_infos: dict[tuple[str, str], DeviceInfo] = {}
+
+        # slugify(symbol) results; symbols are stable so this is never evicted
+        self._slug_cache: dict[str, str] = {}
+
+        # Adaptive polling state
+        self._base_interval = timedelta(minutes=update_interval_minutes)
+        self._idle_interval = timedelta(minutes=max(update_interval_minutes, OFF_HOURS_UPDATE_INTERVAL))
+        self._last_snapshot: tuple[Any, ...] | None = None
+        self._unchanged_cycles = 0
+
+        # Response caches, timestamps from time.monotonic()
+        # Market data (fetched_at, response), only kept while the asset's market is closed
+        self._market_cache: dict[tuple[str, str], tuple[float, dict[str, Any]]] = {}
+        # Accounts (fetched_at, global performance at fetch time, response)
+        self._accounts_cache: tuple[float, dict[str, Any], dict[str, Any]] | None = None
+        # Per-account ((updatedAt, date, global performance), performance, holdings) from the last fetch
+        self._account_cache: dict[str, tuple[tuple[str | None, date, dict[str, Any]], dict[str, Any] | None, list[dict[str, Any]]]] = {}
+
+    def slug(self, symbol: str) -> str:
+        """Return slugify(symbol), memoized across refreshes."""
+        safe_symbol = self._slug_cache.get(symbol)
+        if safe_symbol is None:
+            safe_symbol = self._slug_cache[symbol] = slugify(symbol)
+        return safe_symbol
+
+    def account_device_info(self, account_id: str, account_name: str) -> DeviceInfo:
+        """Return the shared device info of an account (or the watchlist scope)."""
+        key = (account_id, account_name)
+        device_info = self._account_device_infos.get(key)
+        if device_info is None:
+            device_info = self._account_device_infos[key] = DeviceInfo(
+                identifiers={(DOMAIN, f"ghostfolio_account_{account_id}_{self.entry.entry_id}")},
+                name=account_name,
+                manufacturer="Ghostfolio",
+                model="Account Portfolio",
+                via_device=self.portfolio_device_id,
+            )
+        return device_info
 
     async def _async_update_data(self):
         """Fetch data from Ghostfolio API."""
-        
-        # Initialize default "Offline" data structure
-        data = {
-            "server_online": False,
-            "accounts": {},
-            "global_performance": {},
-            "account_performances": {},
-            "account_holdings": {},
-            "watchlist": [],
-            "providers": {}
-        }
-
         try:
-            # 1. Fetch List of Accounts
-            accounts_data = await self.api.get_accounts()
-            accounts_list = accounts_data.get("accounts", [])
-            
-            # 2. Fetch Global Portfolio Performance
+            # 1. Fetch Global Performance first: the accounts list may come from the
+            # cache, so this request tells us whether the server is reachable, and it
+            # renews an expired token once before the parallel requests below
             global_performance = await self.api.get_portfolio_performance()
-            
-            # 3. Fetch Data per Account
-            account_performances = {}
-            holdings_by_account = {}
-            watchlist_items = []
-            
-            # Check config options
-            show_holdings = self.entry.data.get(CONF_SHOW_HOLDINGS, True)
-            show_watchlist = self.entry.data.get(CONF_SHOW_WATCHLIST, True)
 
-            for account in accounts_list:
-                if account.get("isExcluded"):
-                    continue
-                    
-                account_id = account["id"]
-                
-                # A. Fetch Performance
-                try:
-                    perf_data = await self.api.get_portfolio_performance(account_id=account_id)
-                    account_performances[account_id] = perf_data
-                except Exception as e:
-                    _LOGGER.warning(f"Failed to fetch performance for account {account['name']}: {e}")
-
-                # B. Fetch Holdings (if enabled)
-                if show_holdings:
-                    try:
-                        # We fetch per account to ensure we know exactly which account the holding belongs to
-                        holdings_data = await self.api.get_holdings(account_id=account_id)
-                        # The API usually returns { "holdings": [...] }
-                        holdings_by_account[account_id] = holdings_data.get("holdings", [])
-                    except Exception as e:
-                        _LOGGER.warning(f"Failed to fetch holdings for account {account['name']}: {e}")
-
-            # 4. Fetch Watchlist (if enabled)
-            if show_watchlist:
-                try:
-                    wl_response = await self.api.get_watchlist()
-                    # Handle response being list or dict depending on API version
-                    raw_items = []
-                    if isinstance(wl_response, list):
-                        raw_items = wl_response
-                    elif isinstance(wl_response, dict):
-                        raw_items = wl_response.get("watchlist", []) or wl_response.get("items", [])
-                    
-                    # Enrich watchlist items with Market Data (Price & Currency)
-                    for item in raw_items:
-                        symbol = item.get("symbol")
-                        data_source = item.get("dataSource")
-                        
-                        if symbol and data_source:
-                            try:
-                                market_data_resp = await self.api.get_market_data(data_source, symbol)
-                                history = market_data_resp.get("marketData", [])
-                                
-                                if history and isinstance(history, list) and len(history) > 0:
-                                    latest_idx = -1
-                                    max_lookback = 5
-                                    lookback_count = 0
-                                    
-                                    current_entry = history[latest_idx]
-                                    current_price = float(current_entry.get("marketPrice") or 0)
-
-                                    while lookback_count < max_lookback and abs(latest_idx) < len(history):
-                                        prev_idx = latest_idx - 1
-                                        prev_entry = history[prev_idx]
-                                        prev_price = float(prev_entry.get("marketPrice") or 0)
-                                        if current_price != prev_price:
-                                            break
-                                        latest_idx -= 1
-                                        lookback_count += 1
-                                        current_entry = history[latest_idx]
-
-                                    if abs(latest_idx - 1) <= len(history):
-                                        prev_entry = history[latest_idx - 1]
-                                        prev_price = float(prev_entry.get("marketPrice") or 0)
-                                        if prev_price > 0:
-                                            change_val = current_price - prev_price
-                                            change_pct = (change_val / prev_price) * 100
-                                            item["marketChange"] = change_val
-                                            item["marketChangePercentage"] = change_pct
-                                    
-                                    item["marketPrice"] = current_price
-                                    item["marketDate"] = current_entry.get("date")
-                                
-                                profile = market_data_resp.get("assetProfile", {})
-                                if not item.get("currency"):
-                                    item["currency"] = profile.get("currency")
-                                if not item.get("assetClass"):
-                                    item["assetClass"] = profile.get("assetClass")
-                                    
-                            except Exception as err:
-                                _LOGGER.debug(f"Failed to enrich watchlist item {symbol}: {err}")
-                        
-                        watchlist_items.append(item)
-                        
-                except Exception as e:
-                    _LOGGER.warning(f"Failed to fetch watchlist: {e}")
-
-            # 5. Fetch Provider Health (Parallel)
-            provider_results = {}
-            async def _fetch_health(code):
-                return await self.api.get_provider_health(code)
-
-            health_results = await asyncio.gather(*[_fetch_health(p) for p in DATA_PROVIDERS])
-            for res in health_results:
-                provider_results[res["code"]] = res
+            # 2. Fetch List of Accounts
+            accounts_data = await self._get_accounts(global_performance)
+            accounts_list = accounts_data.get("accounts", [])
+            
+            # 3. Fetch Per-Account Data, Watchlist and Provider Health (Parallel)
+            # A failing group falls back to empty data instead of failing the whole refresh.
+            account_results, watchlist_items, provider_results = await asyncio.gather(
+                self._fetch_all_accounts(accounts_list, global_performance),
+                self._fetch_watchlist(self.cfg.show_watchlist),
+                self._fetch_provider_health(),
+                return_exceptions=True,
+            )
+
+            if isinstance(account_results, Exception):
+                _LOGGER.warning(f"Failed to fetch account data: {account_results}")
+                account_results = ({}, {})
+            if isinstance(watchlist_items, Exception):
+                _LOGGER.warning(f"Failed to fetch watchlist: {watchlist_items}")
+                watchlist_items = []
+            if isinstance(provider_results, Exception):
+                _LOGGER.warning(f"Failed to fetch provider health: {provider_results}")
+                provider_results = {}
+
+            account_performances, holdings_by_account = account_results
 
             # --- SUCCESS ---
-            data["server_online"] = True
-            data["accounts"] = accounts_data
-            data["global_performance"] = global_performance
-            data["account_performances"] = account_performances
-            data["account_holdings"] = holdings_by_account
-            data["watchlist"] = watchlist_items
-            data["providers"] = provider_results
+            data = {
+                "server_online": True,
+                "accounts": accounts_data,
+                "global_performance": global_performance,
+                "account_performances": account_performances,
+                "account_holdings": holdings_by_account,
+                "watchlist": watchlist_items,
+                "providers": provider_results
+            }
+
+            self._adjust_update_interval(data)
             
             return data
 
         except Exception as err:
             _LOGGER.warning(f"Ghostfolio API update failed: {err}")
-            return data
+            # Poll at the normal rate so we notice quickly when the server is back
+            self._accounts_cache = None
+            self._unchanged_cycles = 0
+            self.update_interval = self._base_interval
+            return _offline_data()
+
+    def _adjust_update_interval(self, data: dict[str, Any]) -> None:
+        """Poll less often while markets are closed or nothing has changed."""
+        snapshot = (
+            data["global_performance"],
+            [(i.get("symbol"), i.get("marketDate"), i.get("marketPrice")) for i in data["watchlist"]],
+        )
+        if snapshot == self._last_snapshot:
+            self._unchanged_cycles += 1
+        else:
+            self._unchanged_cycles = 0
+        self._last_snapshot = snapshot
+
+        assets = [h for holdings in data["account_holdings"].values() for h in holdings]
+        assets.extend(data["watchlist"])
+
+        idle = self._unchanged_cycles >= UNCHANGED_CYCLES_BEFORE_BACKOFF or not is_market_open(assets)
+        interval = self._idle_interval if idle else self._base_interval
+        if interval != self.update_interval:
+            _LOGGER.debug(f"Changing update interval to {interval}")
+            self.update_interval = interval
+
+    async def _get_accounts(self, global_performance: dict[str, Any]) -> dict[str, Any]:
+        """Return the accounts payload, reusing a recent response while the portfolio is unchanged."""
+        now = time.monotonic()
+        cached = self._accounts_cache
+        # Any new activity or price move changes the global performance, so refetch then
+        if cached and now - cached[0] < ACCOUNTS_CACHE_TTL and cached[1] == global_performance:
+            return cached[2]
+
+        accounts_data = await self.api.get_accounts()
+        self._accounts_cache = (now, global_performance, accounts_data)
+        return accounts_data
+
+    async def _fetch_provider_health(self) -> dict[str, dict[str, Any]]:
+        """Fetch the health of every data provider (Parallel)."""
+        health_results = await asyncio.gather(*[self.api.get_provider_health(code) for code, _ in DATA_PROVIDERS])
+        return {res["code"]: res for res in health_results}
+
+    async def _fetch_all_accounts(self, accounts_list: list[dict[str, Any]], global_performance: dict[str, Any]) -> tuple[dict[str, Any], dict[str, list[dict[str, Any]]]]:
+        """Fetch performance and holdings of all active accounts (Parallel)."""
+        account_performances = {}
+        holdings_by_account = {}
+
+        # Per-account performance only feeds the account sensors
+        need_perf = self.cfg.show_accounts
+        show_holdings = self.cfg.show_holdings
+
+        # Skip the per-account requests entirely if nothing consumes them
+        active_accounts = []
+        if need_perf or show_holdings:
+            active_accounts = [a for a in accounts_list if not a.get("isExcluded")]
+
+        account_results = await asyncio.gather(
+            *[self._fetch_account(a, global_performance, need_perf, show_holdings) for a in active_accounts],
+            return_exceptions=True,
+        )
+
+        # Forget cached results of accounts that were removed or excluded
+        active_ids = {a["id"] for a in active_accounts}
+        for account_id in list(self._account_cache):
+            if account_id not in active_ids:
+                del self._account_cache[account_id]
+
+        for account, result in zip(active_accounts, account_results):
+            if isinstance(result, Exception):
+                _LOGGER.warning(f"Failed to fetch data for account {account['name']}: {result}")
+                continue
+
+            account_id = account["id"]
+            perf_data, holdings = result
+            if perf_data is not None:
+                account_performances[account_id] = perf_data
+            if holdings is not None:
+                holdings_by_account[account_id] = holdings
+
+        return account_performances, holdings_by_account
+
+    async def _fetch_account(self, account: dict[str, Any], global_performance: dict[str, Any], need_perf: bool, show_holdings: bool) -> tuple[dict[str, Any] | None, list[dict[str, Any]] | None]:
+        """Fetch performance and holdings (each if needed) for a single account concurrently."""
+        account_id = account["id"]
+        updated_at = account.get("updatedAt")
+        today = datetime.now(timezone.utc).date()
+
+        # Reuse the previous result if the account is unchanged, it is still the same
+        # day and none of its holdings can move because their markets are closed.
+        # Adding or editing an activity does not touch the account's updatedAt, but it
+        # does change the global performance, which is fetched on every refresh.
+        cache_key = (updated_at, today, global_performance)
+        cached = self._account_cache.get(account_id)
+        if (
+            cached
+            and updated_at
+            and cached[0] == cache_key
+            and not is_market_open(cached[2])
+        ):
+            return cached[1], cached[2]
+
+        async def _skip():
+            return None
+
+        # We fetch holdings per account to ensure we know exactly which account the holding belongs to
+        perf_data, holdings_data = await asyncio.gather(
+            self.api.get_portfolio_performance(account_id=account_id) if need_perf else _skip(),
+            self.api.get_holdings(account_id=account_id) if show_holdings else _skip(),
+            return_exceptions=True,
+        )
+
+        if isinstance(perf_data, Exception):
+            _LOGGER.warning(f"Failed to fetch performance for account {account['name']}: {perf_data}")
+            perf_data = None
+
+        holdings = None
+        if isinstance(holdings_data, Exception):
+            _LOGGER.warning(f"Failed to fetch holdings for account {account['name']}: {holdings_data}")
+        elif holdings_data is not None:
+            # The API usually returns { "holdings": [...] }
+            holdings = holdings_data.get("holdings", [])
+
+        if holdings is not None and (perf_data is not None or not need_perf):
+            self._account_cache[account_id] = (cache_key, perf_data, holdings)
+        return perf_data, holdings
+
+    async def _fetch_watchlist(self, show_watchlist: bool) -> list[dict[str, Any]]:
+        """Fetch watchlist items and enrich them with market data."""
+        watchlist_items = []
+        if not show_watchlist:
+            return watchlist_items
+
+        try:
+            wl_response = await self.api.get_watchlist()
+            # Handle response being list or dict depending on API version
+            raw_items = []
+            if isinstance(wl_response, list):
+                raw_items = wl_response
+            elif isinstance(wl_response, dict):
+                raw_items = wl_response.get("watchlist", []) or wl_response.get("items", [])
+            
+            # Enrich watchlist items with Market Data (Price & Currency) (Parallel)
+            semaphore = asyncio.Semaphore(MARKET_DATA_CONCURRENCY)
+
+            async def _enrich(item):
+                symbol = item.get("symbol")
+                data_source = item.get("dataSource")
+                if not (symbol and data_source):
+                    return
+
+                # Prices cannot move while the market is closed, so reuse market data
+                # fetched after the close; while it is open, refetch on every refresh
+                cache_key = (data_source, symbol)
+                cached = self._market_cache.get(cache_key)
+                now = time.monotonic()
+                if (
+                    cached
+                    and now - cached[0] < MARKET_DATA_CACHE_TTL
+                    and not is_market_open([cached[1].get("assetProfile", {})])
+                ):
+                    market_data_resp = cached[1]
+                else:
+                    async with semaphore:
+                        market_data_resp = await self.api.get_market_data(data_source, symbol)
+                    if is_market_open([market_data_resp.get("assetProfile", {})]):
+                        self._market_cache.pop(cache_key, None)
+                    else:
+                        self._market_cache[cache_key] = (now, market_data_resp)
+
+                history = market_data_resp.get("marketData", [])
+                
+                if history and isinstance(history, list) and len(history) > 0:
+                    # Walk back over unchanged prices (weekends, holidays) to find the last move
+                    max_lookback = 5
+                    tail = history[-(max_lookback + 2):]
+                    prices = [_price(e) for e in tail]
+                    current_price = prices[-1]
+
+                    latest_idx = len(prices) - 1
+                    while latest_idx > 1 and prices[latest_idx - 1] == current_price:
+                        latest_idx -= 1
+                    current_entry = tail[latest_idx]
+
+                    if latest_idx > 0:
+                        prev_price = prices[latest_idx - 1]
+                        if prev_price > 0:
+                            change_val = current_price - prev_price
+                            change_pct = (change_val / prev_price) * 100
+                            item["marketChange"] = change_val
+                            item["marketChangePercentage"] = change_pct
+                    
+                    item["marketPrice"] = current_price
+                    item["marketDate"] = current_entry.get("date")
+                
+                profile = market_data_resp.get("assetProfile", {})
+                if not item.get("currency"):
+                    item["currency"] = profile.get("currency")
+                if not item.get("assetClass"):
+                    item["assetClass"] = profile.get("assetClass")
+
+            results = await asyncio.gather(*[_enrich(i) for i in raw_items], return_exceptions=True)
+            for item, result in zip(raw_items, results):
+                if isinstance(result, Exception):
+                    _LOGGER.debug(f"Failed to enrich watchlist item {item.get('symbol')}: {result}")
+                # Items are enriched in place; keep them even if enrichment failed
+                watchlist_items.append(item)
+
+            # Drop cached market data for symbols no longer on the watchlist
+            active_keys = {(i.get("dataSource"), i.get("symbol")) for i in raw_items}
+            for key in list(self._market_cache):
+                if key not in active_keys:
+                    del self._market_cache[key]
+                
+        except Exception as e:
+            _LOGGER.warning(f"Failed to fetch watchlist: {e}")
+
+        return watchlist_items
 
     async def async_prune_orphans(self) -> None:
         """Remove entities that no longer exist in Ghostfolio."""
@@ -222,82 +517,83 @@ class GhostfolioDataUpdateCoordinator(DataUpdateCoordinator):
         entity_registry = er.async_get(self.hass)
         entries = er.async_entries_for_config_entry(entity_registry, self.entry.entry_id)
         
-        valid_unique_ids = set()
         entry_id = self.entry.entry_id
-        
-        # 1. Global Sensors
-        if self.entry.data.get(CONF_SHOW_TOTALS, True):
-            valid_unique_ids.add(f"ghostfolio_current_value_{entry_id}")
-            valid_unique_ids.add(f"ghostfolio_net_performance_{entry_id}")
-            valid_unique_ids.add(f"ghostfolio_net_performance_percent_{entry_id}")
-            valid_unique_ids.add(f"ghostfolio_total_investment_{entry_id}")
-            valid_unique_ids.add(f"ghostfolio_net_performance_percent_with_currency_{entry_id}")
-            valid_unique_ids.add(f"ghostfolio_net_performance_with_currency_{entry_id}")
-            valid_unique_ids.add(f"ghostfolio_simple_gain_percent_{entry_id}")
-
-        # 2. Binary Sensors (Server + Providers)
-        valid_unique_ids.add(f"ghostfolio_server_status_{entry_id}")
-        for provider in DATA_PROVIDERS:
-            valid_unique_ids.add(f"ghostfolio_provider_{provider.lower()}_{entry_id}")
-
-        # 3. Prune Button
-        valid_unique_ids.add(f"ghostfolio_prune_button_{entry_id}")
+        entry_suffix = f"_{entry_id}"
+
+        # Small lookup tables of what currently exists; unique_ids are matched against
+        # these instead of materialising every valid unique_id up front.
+
+        # 1-3. Global Sensors, Binary Sensors (Server + Providers) and Prune Button
+        static_keys = {"server_status", "prune_button"}
+        static_keys.update(f"provider_{provider_id}" for provider_id in DATA_PROVIDER_IDS)
+        if self.cfg.show_totals:
+            static_keys.update(self._TOTALS_KEYS)
 
         # 4. Accounts
-        show_accounts = self.entry.data.get(CONF_SHOW_ACCOUNTS, True)
         accounts_list = self.data.get("accounts", {}).get("accounts", [])
-        
-        for account in accounts_list:
-            if account.get("isExcluded"):
-                continue
-            
-            account_id = account["id"]
-            if show_accounts:
-                valid_unique_ids.add(f"ghostfolio_account_value_{account_id}_{entry_id}")
-                valid_unique_ids.add(f"ghostfolio_account_cost_{account_id}_{entry_id}")
-                valid_unique_ids.add(f"ghostfolio_account_perf_{account_id}_{entry_id}")
-                valid_unique_ids.add(f"ghostfolio_account_perf_pct_{account_id}_{entry_id}")
-                valid_unique_ids.add(f"ghostfolio_account_simple_gain_{account_id}_{entry_id}")
-
-        # 5. Holdings (Sensors + Numbers)
-        if self.entry.data.get(CONF_SHOW_HOLDINGS, True):
+        active_account_ids = {a["id"] for a in accounts_list if not a.get("isExcluded")}
+
+        # 5. Holdings (Sensors + Numbers): active symbols per account
+        active_holdings_by_account: dict[str, set[str]] = {}
+        if self.cfg.show_holdings:
             all_holdings = self.data.get("account_holdings", {})
-            # Need to iterate per account to match the ID generation logic
-            for account in accounts_list:
-                if account.get("isExcluded"):
-                    continue
-                account_id = account["id"]
-                holdings = all_holdings.get(account_id, [])
-                
-                for h in holdings:
+            for account_id in active_account_ids:
+                slugs = active_holdings_by_account[account_id] = set()
+                for h in all_holdings.get(account_id, []):
+                    symbol = h.get("symbol")
                     # Only active holdings generate sensors
-                    if float(h.get("quantity") or 0) > 0:
-                        symbol = h.get("symbol")
-                        safe_symbol = slugify(symbol)
-                        
-                        # Sensor
-                        valid_unique_ids.add(f"ghostfolio_holding_{account_id}_{safe_symbol}_{entry_id}")
-                        # Numbers
-                        valid_unique_ids.add(f"ghostfolio_limit_low_{account_id}_{safe_symbol}_{entry_id}")
-                        valid_unique_ids.add(f"ghostfolio_limit_high_{account_id}_{safe_symbol}_{entry_id}")
+                    if symbol and is_active_holding(h):
+                        slugs.add(self.slug(symbol))
 
         # 6. Watchlist (Sensors + Numbers)
-        if self.entry.data.get(CONF_SHOW_WATCHLIST, True):
-            watchlist = self.data.get("watchlist", [])
-            for item in watchlist:
+        active_watchlist_slugs: set[str] = set()
+        if self.cfg.show_watchlist:
+            for item in self.data.get("watchlist", []):
                 symbol = item.get("symbol")
-                safe_symbol = slugify(symbol)
-                
-                # Sensor
-                valid_unique_ids.add(f"ghostfolio_watchlist_{safe_symbol}_{entry_id}")
-                # Numbers
-                valid_unique_ids.add(f"ghostfolio_watchlist_limit_low_{safe_symbol}_{entry_id}")
-                valid_unique_ids.add(f"ghostfolio_watchlist_limit_high_{safe_symbol}_{entry_id}")
+                if not symbol:
+                    continue
+                active_watchlist_slugs.add(self.slug(symbol))
+
+        def _is_holding(rest: str) -> bool:
+            # rest is "{account_id}_{safe_symbol}"; account ids are UUIDs without underscores
+            account_id, _, safe_symbol = rest.partition("_")
+            return safe_symbol in active_holdings_by_account.get(account_id, ())
+
+        def _is_valid(uid: str) -> bool:
+            if not uid.startswith("ghostfolio_") or not uid.endswith(entry_suffix):
+                return False
+            key = uid[len("ghostfolio_"):-len(entry_suffix)]
+
+            if key in static_keys:
+                return True
+
+            # Watchlist: watchlist_{safe_symbol}, watchlist_limit_{low|high}_{safe_symbol}
+            if key.startswith("watchlist_"):
+                rest = key[len("watchlist_"):]
+                if rest in active_watchlist_slugs:
+                    return True
+                for prefix in ("limit_low_", "limit_high_"):
+                    if rest.startswith(prefix) and rest[len(prefix):] in active_watchlist_slugs:
+                        return True
+                return False
+
+            # Holdings: holding_{account_id}_{safe_symbol}, limit_{low|high}_{account_id}_{safe_symbol}
+            for prefix in ("holding_", "limit_low_", "limit_high_"):
+                if key.startswith(prefix) and _is_holding(key[len(prefix):]):
+                    return True
+
+            # Accounts: {account_key}_{account_id}
+            if self.cfg.show_accounts:
+                for account_key in self._ACCOUNT_KEYS:
+                    if key.startswith(f"{account_key}_") and key[len(account_key) + 1:] in active_account_ids:
+                        return True
+
+            return False
 
         # Execute Prune
         removed_count = 0
         for entity_entry in entries:
-            if entity_entry.unique_id not in valid_unique_ids:
+            if not _is_valid(entity_entry.unique_id):
                 _LOGGER.info(f"Removing orphaned entity: {entity_entry.entity_id} (unique_id: {entity_entry.unique_id})")
                 entity_registry.async_remove(entity_entry.entity_id)
                 removed_count += 1
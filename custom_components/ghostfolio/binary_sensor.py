@@ -1,18 +1,20 @@
 """Binary sensor platform for Ghostfolio."""
 from __future__ import annotations
 
+from typing import Any
+
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import EntityCategory
 
 from . import GhostfolioDataUpdateCoordinator
-from .const import DOMAIN, DATA_PROVIDERS, CONF_PORTFOLIO_NAME
+from .const import DATA_PROVIDERS
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -28,8 +30,8 @@ async def async_setup_entry(
     entities.append(GhostfolioServerSensor(coordinator, entry))
 
     # 2. Data Provider Sensors
-    for provider in DATA_PROVIDERS:
-        entities.append(GhostfolioProviderSensor(coordinator, entry, provider))
+    for provider_code, nice_name in DATA_PROVIDERS:
+        entities.append(GhostfolioProviderSensor(coordinator, entry, provider_code, nice_name))
         
     async_add_entities(entities)
 
@@ -44,15 +46,10 @@ class GhostfolioServerSensor(CoordinatorEntity, BinarySensorEntity):
     def __init__(self, coordinator: GhostfolioDataUpdateCoordinator, config_entry: ConfigEntry):
         """Initialize the server sensor."""
         super().__init__(coordinator)
-        self.portfolio_name = config_entry.data.get(CONF_PORTFOLIO_NAME, "Ghostfolio")
+        self.portfolio_name = coordinator.cfg.portfolio_name
         self._attr_unique_id = f"ghostfolio_server_status_{config_entry.entry_id}"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"ghostfolio_portfolio_{config_entry.entry_id}")},
-            "name": f"{self.portfolio_name} Portfolio",
-            "manufacturer": "Ghostfolio",
-            "model": "Portfolio Tracker",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def is_on(self) -> bool:
@@ -70,43 +67,46 @@ class GhostfolioProviderSensor(CoordinatorEntity, BinarySensorEntity):
     # Custom translation for Available/Unavailable
     _attr_translation_key = "data_provider"
 
-    def __init__(self, coordinator: GhostfolioDataUpdateCoordinator, config_entry: ConfigEntry, provider_code: str):
+    def __init__(self, coordinator: GhostfolioDataUpdateCoordinator, config_entry: ConfigEntry, provider_code: str, nice_name: str):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.provider_code = provider_code
-        self.portfolio_name = config_entry.data.get(CONF_PORTFOLIO_NAME, "Ghostfolio")
+        self.portfolio_name = coordinator.cfg.portfolio_name
         
-        # Formatting name: "YAHOO" -> "Yahoo Status"
-        nice_name = provider_code.replace("_", " ").title()
+        # "Yahoo" -> "Yahoo Status"
         self._attr_name = f"{nice_name} Status"
         self._attr_unique_id = f"ghostfolio_provider_{provider_code.lower()}_{config_entry.entry_id}"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"ghostfolio_portfolio_{config_entry.entry_id}")},
-            "name": f"{self.portfolio_name} Portfolio",
-            "manufacturer": "Ghostfolio",
-            "model": "Portfolio Tracker",
-        }
+        self._attr_device_info = coordinator.device_info
+
+        # Snapshot of this provider's health, refreshed once per coordinator update
+        self._provider_state = self._get_provider_state()
+
+    def _get_provider_state(self) -> dict[str, Any] | None:
+        """Return this provider's entry from the latest coordinator data."""
+        if not self.coordinator.data:
+            return None
+        return self.coordinator.data.get("providers", {}).get(self.provider_code) or {}
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._provider_state = self._get_provider_state()
+        super()._handle_coordinator_update()
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on (Available)."""
-        if not self.coordinator.data:
+        if self._provider_state is None:
             return None
-        
-        providers = self.coordinator.data.get("providers", {})
-        data = providers.get(self.provider_code, {})
-        return data.get("is_active", False)
+        return self._provider_state.get("is_active", False)
 
     @property
     def extra_state_attributes(self):
         """Return attributes for diagnostics."""
-        if not self.coordinator.data:
+        if self._provider_state is None:
             return {}
-        
-        providers = self.coordinator.data.get("providers", {})
-        data = providers.get(self.provider_code, {})
         return {
-            "status_code": data.get("status_code"),
+            "status_code": self._provider_state.get("status_code"),
             "provider_code": self.provider_code
         }
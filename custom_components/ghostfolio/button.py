@@ -9,7 +9,6 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.const import EntityCategory
 
 from . import GhostfolioDataUpdateCoordinator
-from .const import DOMAIN, CONF_PORTFOLIO_NAME
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -31,15 +30,10 @@ class GhostfolioPruneButton(CoordinatorEntity, ButtonEntity):
     def __init__(self, coordinator: GhostfolioDataUpdateCoordinator, config_entry: ConfigEntry):
         """Initialize the button."""
         super().__init__(coordinator)
-        self.portfolio_name = config_entry.data.get(CONF_PORTFOLIO_NAME, "Ghostfolio")
+        self.portfolio_name = coordinator.cfg.portfolio_name
         self._attr_unique_id = f"ghostfolio_prune_button_{config_entry.entry_id}"
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"ghostfolio_portfolio_{config_entry.entry_id}")},
-            "name": f"{self.portfolio_name} Portfolio",
-            "manufacturer": "Ghostfolio",
-            "model": "Portfolio Tracker",
-        }
+        self._attr_device_info = coordinator.device_info
 
     async def async_press(self) -> None:
         """Handle the button press."""
@@ -17,11 +17,46 @@ CONF_SHOW_WATCHLIST = "show_watchlist"
 DEFAULT_NAME = "Ghostfolio"
 DEFAULT_UPDATE_INTERVAL = 15  # minutes
 
-# Data Providers to check
-DATA_PROVIDERS = [
-    "YAHOO",
-    "COINGECKO",
-    "ALPHA_VANTAGE",
-    "FINANCIAL_MODELING_PREP",
-    "EOD_HISTORICAL_DATA",
-]
+# Adaptive polling: slower interval while markets are closed or data is unchanged
+OFF_HOURS_UPDATE_INTERVAL = 60  # minutes
+UNCHANGED_CYCLES_BEFORE_BACKOFF = 2
+
+# Approximate regular trading sessions in UTC, keyed by quote currency.
+# (open, close) in minutes since midnight, widened to cover daylight saving shifts.
+MARKET_SESSIONS_UTC = {
+    "USD": (13 * 60 + 30, 21 * 60),
+    "CAD": (13 * 60 + 30, 21 * 60),
+    "GBP": (7 * 60, 16 * 60 + 30),
+    "GBp": (7 * 60, 16 * 60 + 30),
+    "EUR": (7 * 60, 16 * 60 + 30),
+    "CHF": (7 * 60, 16 * 60 + 30),
+    "SEK": (7 * 60, 16 * 60 + 30),
+    "NOK": (7 * 60, 16 * 60 + 30),
+    "DKK": (7 * 60, 16 * 60 + 30),
+    "JPY": (0, 6 * 60 + 30),
+    "HKD": (1 * 60 + 30, 8 * 60),
+}
+
+# Maximum number of parallel market data requests for watchlist enrichment
+MARKET_DATA_CONCURRENCY = 8
+
+# Cache lifetimes for slowly changing API responses
+# Market data is only cached while the market is closed; keep this shorter than
+# any trading session so a cached entry can never span a whole session.
+MARKET_DATA_CACHE_TTL = 4 * 60 * 60  # seconds
+ACCOUNTS_CACHE_TTL = 60 * 60  # seconds
+
+# Data Providers to check: (code, display name), e.g. ("ALPHA_VANTAGE", "Alpha Vantage")
+DATA_PROVIDERS = tuple(
+    (code, code.replace("_", " ").title())
+    for code in (
+        "YAHOO",
+        "COINGECKO",
+        "ALPHA_VANTAGE",
+        "FINANCIAL_MODELING_PREP",
+        "EOD_HISTORICAL_DATA",
+    )
+)
+
+# Lowercase provider codes as used in entity unique_ids
+DATA_PROVIDER_IDS = tuple(code.lower() for code, _ in DATA_PROVIDERS)
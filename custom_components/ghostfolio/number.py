@@ -14,13 +14,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.event import async_call_later
-from homeassistant.util import slugify
 
-from . import GhostfolioDataUpdateCoordinator
+from . import GhostfolioDataUpdateCoordinator, is_active_holding
 from .const import (
-    CONF_PORTFOLIO_NAME,
-    CONF_SHOW_HOLDINGS,
-    CONF_SHOW_WATCHLIST,
     DOMAIN,
 )
 
@@ -34,11 +30,17 @@ async def async_setup_entry(
     """Set up Ghostfolio number platform."""
     coordinator = config_entry.runtime_data
     
-    show_holdings = config_entry.data.get(CONF_SHOW_HOLDINGS, True)
-    show_watchlist = config_entry.data.get(CONF_SHOW_WATCHLIST, True)
+    show_holdings = coordinator.cfg.show_holdings
+    show_watchlist = coordinator.cfg.show_watchlist
 
     known_ids: set[str] = set()
 
+    # unique_id pieces shared by every number of this entry
+    entry_suffix = f"_{config_entry.entry_id}"
+    watchlist_prefixes = [
+        (limit_type, f"ghostfolio_watchlist_limit_{limit_type}_") for limit_type in ("low", "high")
+    ]
+
     @callback
     def _update_numbers():
         """Check for new holdings/watchlist items and create limit numbers."""
@@ -55,14 +57,20 @@ async def async_setup_entry(
                 account_name = account["name"]
                 holdings_map = coordinator.data.get("account_holdings", {})
                 holdings_list = holdings_map.get(account_id, [])
+                limit_prefixes = [
+                    (limit_type, f"ghostfolio_limit_{limit_type}_{account_id}_") for limit_type in ("low", "high")
+                ]
 
                 for holding in holdings_list:
-                    if float(holding.get("quantity") or 0) > 0:
+                    if is_active_holding(holding):
                         symbol = holding.get("symbol")
+                        if not symbol:
+                            continue
+                        safe_symbol = coordinator.slug(symbol)
                         
                         # Create Low and High limit entities
-                        for limit_type in ["low", "high"]:
-                            unique_id = f"ghostfolio_limit_{limit_type}_{account_id}_{slugify(symbol)}_{config_entry.entry_id}"
+                        for limit_type, prefix in limit_prefixes:
+                            unique_id = prefix + safe_symbol + entry_suffix
                             
                             if unique_id not in known_ids:
                                 new_entities.append(
@@ -83,8 +91,11 @@ async def async_setup_entry(
             watchlist_items = coordinator.data.get("watchlist", [])
             for item in watchlist_items:
                 symbol = item.get("symbol")
-                for limit_type in ["low", "high"]:
-                    unique_id = f"ghostfolio_watchlist_limit_{limit_type}_{slugify(symbol)}_{config_entry.entry_id}"
+                if not symbol:
+                    continue
+                safe_symbol = coordinator.slug(symbol)
+                for limit_type, prefix in watchlist_prefixes:
+                    unique_id = prefix + safe_symbol + entry_suffix
                     
                     if unique_id not in known_ids:
                         new_entities.append(
@@ -147,16 +158,10 @@ class GhostfolioLimitNumber(CoordinatorEntity, RestoreNumber):
         
         self._attr_native_value = None
         
-        self.portfolio_name = config_entry.data.get(CONF_PORTFOLIO_NAME, "Ghostfolio")
+        self.portfolio_name = coordinator.cfg.portfolio_name
         
         # Device Info: Create a device per Account
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"ghostfolio_account_{account_id}_{config_entry.entry_id}")},
-            "name": account_name, 
-            "manufacturer": "Ghostfolio",
-            "model": "Account Portfolio",
-            "via_device": (DOMAIN, f"ghostfolio_portfolio_{config_entry.entry_id}"),
-        }
+        self._attr_device_info = coordinator.account_device_info(account_id, account_name)
 
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
@@ -197,7 +202,7 @@ class GhostfolioLimitNumber(CoordinatorEntity, RestoreNumber):
     async def _async_trigger_sensor_update(self):
         """Trigger an update on the associated sensor entity."""
         registry = er.async_get(self.hass)
-        safe_symbol = slugify(self.symbol)
+        safe_symbol = self.coordinator.slug(self.symbol)
         
         sensor_unique_id = None
         if self.account_id == "watchlist_scope":
@@ -15,15 +15,9 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers import entity_registry as er
-from homeassistant.util import slugify
 
-from . import GhostfolioDataUpdateCoordinator
+from . import GhostfolioDataUpdateCoordinator, is_active_holding
 from .const import (
-    CONF_PORTFOLIO_NAME,
-    CONF_SHOW_TOTALS,
-    CONF_SHOW_ACCOUNTS,
-    CONF_SHOW_HOLDINGS,
-    CONF_SHOW_WATCHLIST,
     DOMAIN,
 )
 
@@ -38,13 +32,16 @@ async def async_setup_entry(
     """Set up Ghostfolio sensor platform."""
     coordinator = config_entry.runtime_data
     
-    show_totals = config_entry.data.get(CONF_SHOW_TOTALS, True)
-    show_accounts = config_entry.data.get(CONF_SHOW_ACCOUNTS, True)
-    show_holdings = config_entry.data.get(CONF_SHOW_HOLDINGS, True)
-    show_watchlist = config_entry.data.get(CONF_SHOW_WATCHLIST, True)
+    show_totals = coordinator.cfg.show_totals
+    show_accounts = coordinator.cfg.show_accounts
+    show_holdings = coordinator.cfg.show_holdings
+    show_watchlist = coordinator.cfg.show_watchlist
 
     known_ids: set[str] = set()
 
+    # unique_id suffix shared by every sensor of this entry
+    entry_suffix = f"_{config_entry.entry_id}"
+
     # 1. Add Global Portfolio Sensors
     if show_totals:
         global_sensors = [
@@ -95,13 +92,16 @@ async def async_setup_entry(
             if show_holdings:
                 holdings_map = coordinator.data.get("account_holdings", {})
                 holdings_list = holdings_map.get(account_id, [])
+                holding_prefix = f"ghostfolio_holding_{account_id}_"
 
                 for holding in holdings_list:
                     # Ensure valid holding with quantity
-                    if float(holding.get("quantity") or 0) > 0:
+                    if is_active_holding(holding):
                         symbol = holding.get("symbol")
-                        safe_symbol = slugify(symbol)
-                        unique_id = f"ghostfolio_holding_{account_id}_{safe_symbol}_{config_entry.entry_id}"
+                        if not symbol:
+                            continue
+                        safe_symbol = coordinator.slug(symbol)
+                        unique_id = holding_prefix + safe_symbol + entry_suffix
                         
                         if unique_id not in known_ids:
                             sensor = GhostfolioHoldingSensor(
@@ -119,8 +119,10 @@ async def async_setup_entry(
             watchlist_items = coordinator.data.get("watchlist", [])
             for item in watchlist_items:
                 symbol = item.get("symbol")
-                safe_symbol = slugify(symbol)
-                unique_id = f"ghostfolio_watchlist_{safe_symbol}_{config_entry.entry_id}"
+                if not symbol:
+                    continue
+                safe_symbol = coordinator.slug(symbol)
+                unique_id = "ghostfolio_watchlist_" + safe_symbol + entry_suffix
                 
                 if unique_id not in known_ids:
                     sensor = GhostfolioWatchlistSensor(coordinator, config_entry, item)
@@ -145,16 +147,9 @@ class GhostfolioBaseSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.config_entry = config_entry
-        self.portfolio_name = config_entry.data.get(CONF_PORTFOLIO_NAME, "Ghostfolio")
-
-        device_id = f"ghostfolio_portfolio_{config_entry.entry_id}"
+        self.portfolio_name = coordinator.cfg.portfolio_name
 
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, device_id)},
-            "name": f"{self.portfolio_name} Portfolio",
-            "manufacturer": "Ghostfolio",
-            "model": "Portfolio Tracker",
-        }
+        self._attr_device_info = coordinator.device_info
 
     @property
     def native_unit_of_measurement(self) -> str | None:
@@ -211,7 +206,7 @@ class GhostfolioBaseSensor(CoordinatorEntity, SensorEntity):
         for holdings in all_holdings.values():
             for h in holdings:
                 # Check active quantity
-                if float(h.get("quantity") or 0) > 0:
+                if is_active_holding(h):
                      if self._is_provider_down(h.get("dataSource")):
                          return False
         return True
@@ -366,13 +361,7 @@ class GhostfolioAccountBaseSensor(GhostfolioBaseSensor):
         self.account_id = account_data["id"]
         self.account_name = account_data["name"]
         
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"ghostfolio_account_{self.account_id}_{config_entry.entry_id}")},
-            "name": self.account_name, 
-            "manufacturer": "Ghostfolio",
-            "model": "Account Portfolio",
-            "via_device": (DOMAIN, f"ghostfolio_portfolio_{config_entry.entry_id}"),
-        }
+        self._attr_device_info = coordinator.account_device_info(self.account_id, self.account_name)
 
     @property
     def account_performance_data(self) -> dict[str, Any]:
@@ -391,7 +380,7 @@ class GhostfolioAccountBaseSensor(GhostfolioBaseSensor):
         account_holdings = all_holdings.get(self.account_id, [])
         
         for h in account_holdings:
-            if float(h.get("quantity") or 0) > 0:
+            if is_active_holding(h):
                  if self._is_provider_down(h.get("dataSource")):
                      return False
         return True
@@ -524,19 +513,13 @@ class GhostfolioHoldingSensor(GhostfolioBaseSensor):
         self.ticker_name = holding_data.get("name", self.symbol)
 
         # Unique ID
-        safe_symbol = slugify(self.symbol)
+        safe_symbol = self.coordinator.slug(self.symbol)
         self._attr_unique_id = f"ghostfolio_holding_{self.account_id}_{safe_symbol}_{config_entry.entry_id}"
 
         # NAME FIXED: Just the Ticker Name (e.g. "Apple Inc.")
         self._attr_name = self.ticker_name
 
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"ghostfolio_account_{self.account_id}_{config_entry.entry_id}")},
-            "name": self.account_name, 
-            "manufacturer": "Ghostfolio",
-            "model": "Account Portfolio",
-            "via_device": (DOMAIN, f"ghostfolio_portfolio_{config_entry.entry_id}"),
-        }
+        self._attr_device_info = coordinator.account_device_info(self.account_id, self.account_name)
         
         # Track previous limit states for Event Firing
         self._prev_low_reached = False
@@ -580,7 +563,7 @@ class GhostfolioHoldingSensor(GhostfolioBaseSensor):
     def _get_limit_state(self, limit_type: str, current_value: float, compare_op):
         """Helper to check limit status and return (limit_val_or_false, is_reached, limit_val)."""
         registry = er.async_get(self.hass)
-        safe_symbol = slugify(self.symbol)
+        safe_symbol = self.coordinator.slug(self.symbol)
         entry_id = self.config_entry.entry_id
         
         # Reconstruct the Number's unique ID
@@ -718,19 +701,13 @@ class GhostfolioWatchlistSensor(GhostfolioBaseSensor):
         self.data_source = item_data.get("dataSource")
         self.ticker_name = item_data.get("name", self.symbol)
 
-        safe_symbol = slugify(self.symbol)
+        safe_symbol = self.coordinator.slug(self.symbol)
         self._attr_unique_id = f"ghostfolio_watchlist_{safe_symbol}_{config_entry.entry_id}"
 
         # NAME FIXED: Just the Ticker Name
         self._attr_name = self.ticker_name
 
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, f"ghostfolio_account_watchlist_scope_{config_entry.entry_id}")},
-            "name": "Watchlist", 
-            "manufacturer": "Ghostfolio",
-            "model": "Account Portfolio",
-            "via_device": (DOMAIN, f"ghostfolio_portfolio_{config_entry.entry_id}"),
-        }
+        self._attr_device_info = coordinator.account_device_info("watchlist_scope", "Watchlist")
         
         # Track previous limit states for Event Firing
         self._prev_low_reached = False
@@ -787,7 +764,7 @@ class GhostfolioWatchlistSensor(GhostfolioBaseSensor):
     def _get_limit_state(self, limit_type: str, current_value: float, compare_op):
         """Helper to check limit status and return (limit_val_or_false, is_reached, limit_val)."""
         registry = er.async_get(self.hass)
-        safe_symbol = slugify(self.symbol)
+        safe_symbol = self.coordinator.slug(self.symbol)
         entry_id = self.config_entry.entry_id
         
         # Reconstruct the Number's unique ID